@@ -3,6 +3,9 @@ from pathlib import Path
 
 from typing import Optional
 
+# Values read as enabled for boolean settings; writes use the canonical "true"/"false"
+_TRUTHY = frozenset(("true", "1", "yes", "on"))
+
 class ConfigManager:
     """
     Handles reading and writing configuration settings to a file (config.ini).
@@ -10,6 +13,7 @@ class ConfigManager:
     def __init__(self, config_file="config.ini"):
         self.config_path = Path(config_file)
         self.config = configparser.ConfigParser()
+        self._version = 0
         self._load()
 
     def _load(self):
@@ -22,15 +26,33 @@ class ConfigManager:
         with self.config_path.open("w") as f:
             self.config.write(f)
 
+    @property
+    def version(self) -> int:
+        """Counter bumped on every change, for callers that cache derived values."""
+        return self._version
+
     def get_setting(self, section: str, key: str, fallback: Optional[str] = None) -> Optional[str]:
         """Gets a specific setting value."""
         return self.config.get(section, key, fallback=fallback)
 
+    def get_bool_setting(self, section: str, key: str, fallback: bool = False) -> bool:
+        """Gets a boolean setting, accepting true/1/yes/on in any case."""
+        value = self.config.get(section, key, fallback=None)
+        if not value:
+            return fallback
+        # Canonical values skip the lowercase copy
+        if value in _TRUTHY:
+            return True
+        if value == "false":
+            return False
+        return value.lower() in _TRUTHY
+
     def update_setting(self, section: str, key: str, value: str):
         """Updates or adds a specific setting."""
         if not self.config.has_section(section):
             self.config.add_section(section)
         self.config.set(section, key, str(value))
+        self._version += 1
         self._save()
 
     def remove_setting(self, section: str, key: str):
@@ -40,6 +62,7 @@ class ConfigManager:
             # Remove section if it's empty
             if not self.config.options(section):
                 self.config.remove_section(section)
+            self._version += 1
             self._save()
 
     def delete_all_settings(self):
@@ -48,6 +71,7 @@ class ConfigManager:
             self.config_path.unlink()
         # Reset the in-memory config object
         self.config = configparser.ConfigParser()
+        self._version += 1
 
 # Create a single instance to be used throughout the application
 config_manager = ConfigManager()
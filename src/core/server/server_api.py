@@ -1,6 +1,6 @@
 import logging
 import asyncio
-from typing import Optional
+from typing import Optional, Sequence
 from supabase import create_async_client, AsyncClient
 import numpy as np
 from realtime import RealtimeSubscribeStates
@@ -229,12 +229,15 @@ class ServerAPI:
         if not self.client:
             return False
 
+        # Snapshot now: callers may reuse the array before the subscribe callback runs
+        values = heatmap.ravel().tolist()
+
         if device_id in self.device_channels:
             try:
                 channel = self.device_channels[device_id]
                 await channel.send_broadcast(
                     'heatmap_update',
-                    {"values": heatmap.flatten().tolist()}
+                    {"values": values}
                 )
                 return True
             except Exception as e:
@@ -251,7 +254,7 @@ class ServerAPI:
                 # Schedule the async broadcast
                 asyncio.create_task(channel.send_broadcast(
                     'heatmap_update',
-                    {"values": heatmap.flatten().tolist()}
+                    {"values": values}
                 ))
             if err:
                 self.server_logger.error(f"Error subscribing to channel for device {device_id}: {err}")
@@ -263,6 +266,20 @@ class ServerAPI:
             self.server_logger.error(f"Error subscribing to channel for device {device_id}: {e}")
             return False
 
+    async def update_heatmaps_bulk(self, updates: Sequence[tuple[int, np.ndarray]]) -> list[bool]:
+        """Send several heatmap updates concurrently. Results follow the order of updates."""
+        if not self.client:
+            return [False] * len(updates)
+
+        results = await asyncio.gather(
+            *(self.update_heatmap(device_id, heatmap) for device_id, heatmap in updates),
+            return_exceptions=True
+        )
+        for (device_id, _), result in zip(updates, results):
+            if isinstance(result, BaseException):
+                self.server_logger.error(f"Error sending heatmap update for device {device_id}: {result}")
+        return [result is True for result in results]
+
     def update_heatmap_sync(self, device_id: int, heatmap: np.ndarray) -> bool:
         """Synchronous wrapper for update_heatmap to be used from threads."""
         try:
@@ -3,6 +3,8 @@
 import sys
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # Add the src directory to the Python path
@@ -13,12 +15,18 @@ from tui.main_app import MainApp
 from core.config.config_manager import config_manager
 
 
-def setup_logging():
-    """Setup logging based on debug configuration."""
-    debug_enabled = config_manager.get_setting("debug", "debug_enabled", fallback="false")
-    debug_enabled = debug_enabled if debug_enabled else "false"
+def setup_logging() -> QueueListener:
+    """
+    Setup logging based on debug configuration.
+    Records are queued and written by a listener thread so worker threads never
+    block on log I/O (or write to the terminal) while the TUI is drawing.
+    """
+    debug_enabled = config_manager.get_bool_setting("debug", "debug_enabled")
+
+    handlers = []
+    root_logger = logging.getLogger()
     
-    if debug_enabled.lower() in ["true", "1", "yes", "on"]:
+    if debug_enabled:
         # Create logs directory
         log_dir = "logs"
         os.makedirs(log_dir, exist_ok=True)
@@ -27,19 +35,24 @@ def setup_logging():
         debug_file = config_manager.get_setting("debug", "debug_file", fallback="debug.log")
         log_filename = os.path.join(log_dir, debug_file)
         
-        # Configure root logger - file only
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[logging.FileHandler(log_filename, encoding='utf-8')]
-        )
+        # File only
+        file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+        handlers.append(file_handler)
+        root_logger.setLevel(logging.DEBUG)
+
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    return listener
 
 
 def main():
     """
     Main entry point for the Bed Solution TUI application.
     """
-    setup_logging()
+    log_listener = setup_logging()
     
     try:
         app = MainApp()
@@ -49,6 +62,8 @@ def main():
     except Exception as e:
         print(f"An error occurred: {e}")
         sys.exit(1)
+    finally:
+        log_listener.stop()
 
 
 if __name__ == "__main__":
@@ -8,6 +8,9 @@ class MenuComponent:
         self.items = items
         self.selected_index = selected_index
 
+    def reset_selection(self):
+        self.selected_index = 0
+
     def move_up(self):
         self.selected_index = (self.selected_index - 1) % len(self.items)
 
@@ -20,12 +23,11 @@ class MenuComponent:
     def get_selected_index(self) -> int:
         return self.selected_index
 
-    def render(self, x: int, y: int):
+    def render_lines(self) -> List[str]:
+        lines = []
         for i, item in enumerate(self.items):
-            item_y = y + i
             if i == self.selected_index:
-                with self.terminal.location(x, item_y):
-                    print(self.terminal.bold_cyan + "➤ " + item + self.terminal.normal)
+                lines.append(self.terminal.bold_cyan + "➤ " + item + self.terminal.normal)
             else:
-                with self.terminal.location(x, item_y):
-                    print("  " + item)
\ No newline at end of file
+                lines.append("  " + item)
+        return lines
\ No newline at end of file
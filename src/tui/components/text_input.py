@@ -1,6 +1,8 @@
 from blessed import Terminal
 from typing import Optional
 
+from ..utils.masking import mask_password
+
 
 class TextInputDialog:
     def __init__(self, terminal: Terminal, title: str, current_value: str = "", masked: bool = False):
@@ -11,90 +13,108 @@ class TextInputDialog:
         self.cursor_pos = len(current_value)
         self.cancelled = False
         self.masked = masked
+        # Box, labels and instructions never change while the dialog is open
+        self._static = ""
+        self._static_geometry = None
+
+    def compose(self, x: int, y: int, width: int, height: int, static: bool = True) -> str:
+        """
+        Return the escape sequences that draw the dialog at the given position.
+        With static=False only the input line is drawn; the rest is assumed on screen.
+        """
+        if not static:
+            return self._compose_input_line(x, y, width)
+        geometry = (x, y, width, height)
+        if self._static_geometry != geometry:
+            self._static = self._compose_static(x, y, width, height)
+            self._static_geometry = geometry
+        return self._static + self._compose_input_line(x, y, width)
+
+    def _compose_static(self, x: int, y: int, width: int, height: int) -> str:
+        move_xy = self.terminal.move_xy
+        out = []
 
-    def render(self, x: int, y: int, width: int, height: int):
         # Draw dialog box
-        self._draw_box(x, y, width, height)
+        out.append(self._compose_box(x, y, width, height))
         
         # Title
         title_x = x + (width - len(self.title)) // 2
-        with self.terminal.location(title_x, y + 1):
-            print(self.terminal.bold + self.title + self.terminal.normal)
+        out.append(move_xy(title_x, y + 1) + self.terminal.bold + self.title + self.terminal.normal)
         
         # Current value label
         if self.masked and self.current_value:
-            if len(self.current_value) > 12:
-                display_current = f"{self.current_value[:4]}{'*' * 8}{self.current_value[-4:]}"
-            else:
-                display_current = "*" * len(self.current_value)
+            display_current = mask_password(self.current_value)
         else:
             display_current = self.current_value
         
         current_label = f"Current: {display_current}"
-        with self.terminal.location(x + 2, y + 3):
-            print(self.terminal.dim + current_label + self.terminal.normal)
+        out.append(move_xy(x + 2, y + 3) + self.terminal.dim + current_label + self.terminal.normal)
         
         # Input field
         input_label = "New value: "
-        with self.terminal.location(x + 2, y + 5):
-            print(input_label, end="")
+        out.append(move_xy(x + 2, y + 5) + input_label)
         
         # Input box
         input_box_x = x + 2 + len(input_label)
         input_box_width = width - 4 - len(input_label)
         
-        with self.terminal.location(input_box_x, y + 5):
-            print("┌" + "─" * (input_box_width - 2) + "┐")
-        with self.terminal.location(input_box_x, y + 6):
-            # Display input text with cursor
-            actual_text = self.input_value
-            display_text = "*" * len(actual_text) if self.masked else actual_text
-            
-            if len(display_text) > input_box_width - 4:
-                # Scroll text if too long
-                start_pos = max(0, self.cursor_pos - (input_box_width - 6))
-                display_text = display_text[start_pos:start_pos + input_box_width - 4]
-                cursor_display_pos = self.cursor_pos - start_pos
-            else:
-                cursor_display_pos = self.cursor_pos
-            
-            print("│", end="")
-            for i, char in enumerate(display_text):
-                if i == cursor_display_pos:
-                    print(self.terminal.reverse + char + self.terminal.normal, end="")
-                else:
-                    print(char, end="")
-            
-            # Show cursor at end if needed
-            remaining_space = input_box_width - 4 - len(display_text)
-            if cursor_display_pos == len(display_text) and remaining_space > 0:
-                print(self.terminal.reverse + " " + self.terminal.normal, end="")
-                remaining_space -= 1
-            
-            print(" " * remaining_space + "│")
-            
-        with self.terminal.location(input_box_x, y + 7):
-            print("└" + "─" * (input_box_width - 2) + "┘")
+        out.append(move_xy(input_box_x, y + 5) + "┌" + "─" * (input_box_width - 2) + "┐")
+        out.append(move_xy(input_box_x, y + 7) + "└" + "─" * (input_box_width - 2) + "┘")
         
         # Instructions
         instructions = "Press Enter to save, Esc to cancel, ←→ to move cursor"
         instr_x = x + (width - len(instructions)) // 2
-        with self.terminal.location(instr_x, y + height - 2):
-            print(self.terminal.dim + instructions + self.terminal.normal)
+        out.append(move_xy(instr_x, y + height - 2) + self.terminal.dim + instructions + self.terminal.normal)
+        return "".join(out)
+
+    def _compose_input_line(self, x: int, y: int, width: int) -> str:
+        input_label = "New value: "
+        input_box_x = x + 2 + len(input_label)
+        input_box_width = width - 4 - len(input_label)
+        out = []
+
+        # Display input text with cursor
+        actual_text = self.input_value
+        display_text = "*" * len(actual_text) if self.masked else actual_text
+        
+        if len(display_text) > input_box_width - 4:
+            # Scroll text if too long
+            start_pos = max(0, self.cursor_pos - (input_box_width - 6))
+            display_text = display_text[start_pos:start_pos + input_box_width - 4]
+            cursor_display_pos = self.cursor_pos - start_pos
+        else:
+            cursor_display_pos = self.cursor_pos
+        
+        out.append(self.terminal.move_xy(input_box_x, y + 6) + "│")
+        if cursor_display_pos < len(display_text):
+            out.append(display_text[:cursor_display_pos])
+            out.append(self.terminal.reverse + display_text[cursor_display_pos] + self.terminal.normal)
+            out.append(display_text[cursor_display_pos + 1:])
+        else:
+            out.append(display_text)
+        
+        # Show cursor at end if needed
+        remaining_space = input_box_width - 4 - len(display_text)
+        if cursor_display_pos == len(display_text) and remaining_space > 0:
+            out.append(self.terminal.reverse + " " + self.terminal.normal)
+            remaining_space -= 1
+        
+        out.append(" " * remaining_space + "│")
+        return "".join(out)
 
-    def _draw_box(self, x: int, y: int, width: int, height: int):
+    def _compose_box(self, x: int, y: int, width: int, height: int) -> str:
+        move_xy = self.terminal.move_xy
         # Top border
-        with self.terminal.location(x, y):
-            print("┌" + "─" * (width - 2) + "┐")
+        lines = [move_xy(x, y) + "┌" + "─" * (width - 2) + "┐"]
         
         # Side borders
+        side = "│" + " " * (width - 2) + "│"
         for i in range(1, height - 1):
-            with self.terminal.location(x, y + i):
-                print("│" + " " * (width - 2) + "│")
+            lines.append(move_xy(x, y + i) + side)
         
         # Bottom border
-        with self.terminal.location(x, y + height - 1):
-            print("└" + "─" * (width - 2) + "┘")
+        lines.append(move_xy(x, y + height - 1) + "└" + "─" * (width - 2) + "┘")
+        return "".join(lines)
 
     def handle_input(self, key: str) -> Optional[str]:
         if key == 'KEY_ESCAPE':
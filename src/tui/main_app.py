@@ -1,3 +1,8 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
 from blessed import Terminal
 from typing import Dict, Optional
 
@@ -9,6 +14,11 @@ from .utils.keyboard import KeyHandler
 from core.server import ServerAPI
 from service.device_manager import DeviceManager
 
+# Minimum time between two renders; input arriving faster is coalesced into one frame
+FRAME_INTERVAL = 1 / 60
+# How long to wait for the terminal to answer the synchronized output query
+SYNC_PROBE_TIMEOUT = 0.25
+
 
 class MainApp:
     def __init__(self):
@@ -17,6 +27,20 @@ class MainApp:
         self.current_screen: Optional[BaseScreen] = None
         self.screens: Dict[str, BaseScreen] = {}
         self.running = True
+        self._last_render_ts = 0.0
+        self.logger = logging.getLogger(__name__)
+
+        # Rendering happens on its own thread so a slow terminal never delays input
+        # handling. The lock keeps input handling and rendering from interleaving.
+        self._render_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._screen_lock = threading.RLock()
+        self._render_thread: Optional[threading.Thread] = None
+        self._render_error: Optional[Exception] = None
+        self._supports_sync = False
+        self._terminal_size = (self.terminal.width, self.terminal.height)
+        # One event loop, on its own thread, shared by all background network I/O
+        self.loop = asyncio.new_event_loop()
+        self._loop_thread: Optional[threading.Thread] = None
         self.server_api = ServerAPI()
         self.device_manager = DeviceManager(self.server_api)
 
@@ -37,49 +61,159 @@ class MainApp:
     def quit(self):
         self.running = False
 
+    def _probe_synchronized_output(self) -> bool:
+        """Ask the terminal (DECRQM) whether it supports synchronized output."""
+        # Older blessed releases have no query support; treat that as unsupported
+        probe = getattr(self.terminal, "does_synchronized_output", None)
+        if probe is None:
+            return False
+        try:
+            return bool(probe(timeout=SYNC_PROBE_TIMEOUT))
+        except Exception:
+            self.logger.debug("Synchronized output probe failed", exc_info=True)
+            return False
+
+    def render_current_screen(self):
+        screen = self.current_screen
+        if not screen:
+            return
+        size = (self.terminal.width, self.terminal.height)
+        if size != self._terminal_size:
+            self._terminal_size = size
+            for each in self.screens.values():
+                each.on_resize(*size)
+        if screen.should_clear():
+            screen.clear_screen()
+        screen.render()
+        screen.flush()
+        self._last_render_ts = time.monotonic()
+
+    def request_render(self):
+        """Ask the render thread for a frame; requests made while one is pending coalesce."""
+        try:
+            self._render_queue.put_nowait(True)
+        except queue.Full:
+            pass
+
+    def _render_worker(self):
+        while True:
+            if self._render_queue.get() is None:
+                return
+
+            # Respect the frame budget, then fold in requests that arrived meanwhile
+            delay = self._last_render_ts + FRAME_INTERVAL - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                if self._render_queue.get_nowait() is None:
+                    return
+            except queue.Empty:
+                pass
+
+            with self._screen_lock:
+                try:
+                    self.render_current_screen()
+                except Exception as exc:
+                    self.logger.exception("Render failed")
+                    self._render_error = exc
+                    self.running = False
+                    return
+
+    def _start_render_worker(self):
+        self._render_thread = threading.Thread(
+            target=self._render_worker,
+            daemon=True,
+            name="RenderWorker"
+        )
+        self._render_thread.start()
+
+    def _stop_render_worker(self):
+        thread = self._render_thread
+        if not thread:
+            return
+        try:
+            self._render_queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._render_queue.put(None)
+
+        # Wait in short slices so Ctrl+C stays responsive during shutdown
+        deadline = time.monotonic() + 2.0
+        while thread.is_alive() and time.monotonic() < deadline:
+            thread.join(timeout=0.25)
+        self._render_thread = None
+
+    def _start_async_loop(self):
+        self._loop_thread = threading.Thread(
+            target=self.loop.run_forever,
+            daemon=True,
+            name="AsyncLoop"
+        )
+        self._loop_thread.start()
+
+    def _stop_async_loop(self):
+        thread = self._loop_thread
+        if not thread:
+            return
+
+        async def _cancel_pending():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_cancel_pending(), self.loop).result(timeout=2.0)
+        except Exception:
+            self.logger.warning("Timed out cancelling background tasks", exc_info=True)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        thread.join(timeout=2.0)
+        if not thread.is_alive():
+            self.loop.close()
+        self._loop_thread = None
+
     def run(self):
         try:
+            self._start_async_loop()
             self.initialize_screens()
             
-            # Initial render
-            if self.current_screen and self.current_screen.should_clear():
-                print(self.terminal.home + self.terminal.clear, end='')
-            if self.current_screen:
-                self.current_screen.render()
-            
-            while self.running and self.current_screen:
-                screen = self.current_screen
-                key = self.key_handler.get_key()
-                has_input = bool(key)
-                needs_render = has_input or (screen and screen.needs_periodic_render())
-
-                if not needs_render:
-                    continue
-
-                screen = self.current_screen
-                if not screen:
-                    break
-
-                if screen.should_clear():
-                    print(self.terminal.home + self.terminal.clear, end='')
-
-                result = None
-                if has_input:
-                    result = screen.handle_input(key)
-
-                if result:
-                    self.navigate_to(result)
-                    screen = self.current_screen
-                    if not screen:
+            with self.terminal.cbreak(), self.terminal.hidden_cursor():
+                self._supports_sync = self._probe_synchronized_output()
+                for screen in self.screens.values():
+                    screen.sync_output = self._supports_sync
+
+                self._start_render_worker()
+
+                # Initial render
+                self.request_render()
+
+                while self.running and self.current_screen:
+                    key = self.key_handler.get_key()
+
+                    # Handle every key that is already queued before asking for a frame
+                    needs_render = False
+                    while key and self.running:
+                        with self._screen_lock:
+                            result = self.current_screen.handle_input(key)
+                            if result:
+                                self.navigate_to(result)
+                        needs_render = True
+                        if result:
+                            break
+                        key = self.key_handler.get_key(timeout=0)
+
+                    if not self.running or not self.current_screen:
                         break
-                    if screen.should_clear():
-                        print(self.terminal.home + self.terminal.clear, end='')
 
-                if screen:
-                    screen.render()
+                    if needs_render or self.current_screen.needs_periodic_render():
+                        self.request_render()
                     
         except KeyboardInterrupt:
             pass
         finally:
+            self._stop_render_worker()
+            self._stop_async_loop()
             print(self.terminal.normal)
 
+        if self._render_error:
+            raise self._render_error
@@ -1,15 +1,29 @@
+import sys
 from abc import ABC, abstractmethod
 from blessed import Terminal
 from typing import Optional
 
+from ..components.menu import MenuComponent
+
+# Begin/end synchronized update: the terminal presents everything in between at once
+SYNC_BEGIN = "\x1b[?2026h"
+SYNC_END = "\x1b[?2026l"
+
 
 class BaseScreen(ABC):
+    __slots__ = ("terminal", "height", "width", "running", "_render_buf", "sync_output")
+
     def __init__(self, terminal: Terminal):
         self.terminal = terminal
         # Use smaller fixed window size instead of full terminal
         self.height = min(35, terminal.height - 2)  # Max 35 rows, leave space for prompt
         self.width = min(120, terminal.width - 2)   # Max 120 cols, leave some margin
         self.running = True
+        # Output of a render is collected here and written with a single flush()
+        self._render_buf: list[str] = []
+        # Wrap each flush in a synchronized update (DEC mode 2026); set by the app
+        # once the terminal has confirmed support
+        self.sync_output = False
 
     @abstractmethod
     def render(self):
@@ -19,6 +33,11 @@ class BaseScreen(ABC):
     def handle_input(self, key: str) -> Optional[str]:
         pass
 
+    def on_resize(self, width: int, height: int):
+        """Called by the app when the terminal size changes."""
+        self.height = min(35, height - 2)
+        self.width = min(120, width - 2)
+
     def should_clear(self) -> bool:
         """Return False when the screen manages its own full-screen output."""
         return True
@@ -28,7 +47,7 @@ class BaseScreen(ABC):
         return False
 
     def clear_screen(self):
-        print(self.terminal.home + self.terminal.clear)
+        self.write(self.terminal.home + self.terminal.clear)
 
     def draw_border(self, title: str = "", x: int = 0, y: int = 0, width: int = None, height: int = None):
         if width is None:
@@ -36,31 +55,43 @@ class BaseScreen(ABC):
         if height is None:
             height = self.height
 
-        with self.terminal.location(x, y):
-            print("┌" + "─" * (width - 2) + "┐")
+        self.draw_text("┌" + "─" * (width - 2) + "┐", x, y)
             
         for i in range(1, height - 1):
-            with self.terminal.location(x, y + i):
-                print("│" + " " * (width - 2) + "│")
+            self.draw_text("│" + " " * (width - 2) + "│", x, y + i)
                 
-        with self.terminal.location(x, y + height - 1):
-            print("└" + "─" * (width - 2) + "┘")
+        self.draw_text("└" + "─" * (width - 2) + "┘", x, y + height - 1)
 
         if title:
             title_x = x + (width - len(title)) // 2
-            with self.terminal.location(title_x, y):
-                print(title)
+            self.draw_text(title, title_x, y)
+
+    def write(self, text: str):
+        self._render_buf.append(text)
+
+    def flush(self):
+        """Write everything drawn since the last flush in one go."""
+        if not self._render_buf:
+            return
+        if self.sync_output:
+            self._render_buf.insert(0, SYNC_BEGIN)
+            self._render_buf.append(SYNC_END)
+        sys.stdout.write("".join(self._render_buf))
+        sys.stdout.flush()
+        self._render_buf.clear()
 
     def draw_text(self, text: str, x: int, y: int, color=None):
-        with self.terminal.location(x, y):
-            if color:
-                print(color + text + self.terminal.normal)
-            else:
-                print(text)
+        if color:
+            text = color + text + self.terminal.normal
+        self._render_buf.append(self.terminal.move_xy(x, y) + text)
 
     def center_text(self, text: str, y: int, color=None):
         x = (self.width - len(text)) // 2
         self.draw_text(text, x, y, color)
 
+    def draw_menu(self, menu: MenuComponent, x: int, y: int):
+        for i, line in enumerate(menu.render_lines()):
+            self.draw_text(line, x, y + i)
+
     def quit(self):
         self.running = False
@@ -36,7 +36,7 @@ class MainMenuScreen(BaseScreen):
         
         menu_y = start_y + len(ascii_title) + 2
         menu_x = (self.width - 20) // 2
-        self.menu.render(menu_x, menu_y)
+        self.draw_menu(self.menu, menu_x, menu_y)
         
         self.center_text("Use ↑↓ to navigate, Enter to select", self.height - 4, self.terminal.dim)
 
@@ -9,6 +9,10 @@ from core.server import ServerAPI
 from core.serialcm import SerialCommunication
 from blessed import Terminal
 from typing import Optional
+import asyncio
+import logging
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 import threading
 import numpy as np
 from datetime import datetime
@@ -22,6 +26,17 @@ from rich.text import Text
 from rich.console import Console, Group
 from rich.align import Align
 
+# Normalized pressure thresholds and the Rich markup cell for each bucket
+_PRESSURE_BINS = np.array([0.2, 0.3, 0.5, 0.7], dtype=np.float32)
+_CELL_LUT = np.array(
+    ["[blue]░[/]", "[cyan]▒[/]", "[yellow]▓[/]", "[red]█[/]", "[bright_red]█[/]"],
+    dtype=object,
+)
+_ROW_CACHE_SIZE = 256
+
+# Poll interval while waiting on a lookup, so a cancelled check stops waiting promptly
+_LOOKUP_POLL_INTERVAL = 0.25
+
 
 class RunScreen(BaseScreen):
     def __init__(self, terminal: Terminal, app, server_api: ServerAPI, device_register: DeviceManager):
@@ -29,12 +44,13 @@ class RunScreen(BaseScreen):
         self.app = app
         self.server_api = server_api
         self.device_register = device_register
+        self.logger = logging.getLogger(__name__)
         self.device_data = None
         self.patient_data = None
         self.device_status = DeviceStatus.CHECKING
         self.patient_status = PatientStatus.CHECKING
         self.server_config_valid = False
-        self.missing_server_settings = []
+        self.missing_server_settings = ()
         
         # Real-time monitoring components
         self.serial_comm = None
@@ -53,15 +69,23 @@ class RunScreen(BaseScreen):
         self.max_logs_display = 4
         self.log_scroll_offset = 0
         self.log_follow_latest = True
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
         
         # Rich components for live display
         self.console = Console()
+        self._row_cache: OrderedDict[bytes, str] = OrderedDict()
         self.live_display = None
         self.live_layout = None
+        self._layout_dims = None
         
-        # Render coordination
-        self.render_event = threading.Event()
-        self.render_event.set()
+        # Render coordination: producers bump the dirty version, the renderer
+        # records the version it last drew. Starts dirty so the first frame renders.
+        self._dirty_version = 1
+        self._rendered_version = 0
+        # Log scrolling only touches the logs panel, so it is tracked separately
+        self._logs_version = 0
+        self._rendered_logs_version = 0
         
         # Check server configuration first
         self.server_config_valid, self.missing_server_settings = ServerValidator.validate_server_config()
@@ -70,7 +94,9 @@ class RunScreen(BaseScreen):
         
         # Defer device/patient check until the screen is rendered
         self._initial_check_pending = self.server_config_valid and bool(self.server_api and self.device_register)
-        self._device_patient_thread = None
+        # One worker: a new check queues behind a stale one and never overlaps it
+        self._device_patient_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="DevicePatientCheck")
+        self._device_patient_future: Optional[Future] = None
         self._device_patient_stop_event: Optional[threading.Event] = None
     
     def _initialize_monitoring_components(self) -> bool:
@@ -97,79 +123,93 @@ class RunScreen(BaseScreen):
 
         if force:
             self._cancel_device_patient_check()
-        elif self._device_patient_thread and self._device_patient_thread.is_alive():
+        elif self._device_patient_future and not self._device_patient_future.done():
             return
 
         stop_event = threading.Event()
-        thread = threading.Thread(
-            target=self._check_device_and_patient_async,
-            args=(stop_event,),
-            daemon=True,
-            name="DevicePatientCheck"
-        )
         self._device_patient_stop_event = stop_event
-        self._device_patient_thread = thread
-        thread.start()
+        self._device_patient_future = self._device_patient_executor.submit(
+            self._check_device_and_patient_async, stop_event
+        )
 
     def _check_device_and_patient_async(self, stop_event: threading.Event):
+        # A cancelled check must not touch shared state: stop_event is checked
+        # before every write and before each network step
         try:
             if stop_event.is_set():
                 return
 
             if self.device_register.is_registered():
-                device_id = self.device_register.get_device_id()
-                self.device_data = self.server_api.fetch_device(device_id) if not stop_event.is_set() else None
-                
+                missing_status = DeviceStatus.NOT_FOUND
+            else:
+                # Device not registered - try to auto-register
+                if stop_event.is_set():
+                    return
+                self.device_status = DeviceStatus.REGISTERING
                 if stop_event.is_set():
                     return
+                registered = self.device_register.register_device()
+                if stop_event.is_set():
+                    return
+                if not registered:
+                    self.device_status = DeviceStatus.REGISTRATION_FAILED
+                    return
+                missing_status = DeviceStatus.REGISTRATION_FAILED
 
-                if self.device_data:
-                    self.device_status = DeviceStatus.REGISTERED
-                    self.patient_data = (
-                        self.server_api.fetch_patient_with_device(device_id)
-                        if not stop_event.is_set()
-                        else None
-                    )
-                    
-                    if self.patient_data:
-                        self.patient_status = PatientStatus.CONNECTED
-                        self.monitoring_error = None
-                    else:
-                        self.patient_status = PatientStatus.NO_PATIENT
+            device_id = self.device_register.get_device_id()
+            device_data, patient_data = self._fetch_device_and_patient(device_id, stop_event)
+            if stop_event.is_set():
+                return
+
+            self.device_data = device_data
+            if self.device_data:
+                self.device_status = DeviceStatus.REGISTERED
+                self.patient_data = patient_data
+
+                if self.patient_data:
+                    self.patient_status = PatientStatus.CONNECTED
+                    self.monitoring_error = None
                 else:
-                    self.device_status = DeviceStatus.NOT_FOUND
+                    self.patient_status = PatientStatus.NO_PATIENT
             else:
-                # Device not registered - try to auto-register
-                self.device_status = DeviceStatus.REGISTERING
-                if self.device_register.register_device():
-                    # Registration successful, check again
-                    device_id = self.device_register.get_device_id()
-                    self.device_data = self.server_api.fetch_device(device_id)
-                    
-                    if self.device_data:
-                        self.device_status = DeviceStatus.REGISTERED
-                        self.patient_data = self.server_api.fetch_patient_with_device(device_id)
-                        
-                        if self.patient_data:
-                            self.patient_status = PatientStatus.CONNECTED
-                            self.monitoring_error = None
-                        else:
-                            self.patient_status = PatientStatus.NO_PATIENT
-                    else:
-                        self.device_status = DeviceStatus.REGISTRATION_FAILED
-                else:
-                    self.device_status = DeviceStatus.REGISTRATION_FAILED
+                self.device_status = missing_status
         except Exception:
-            self.device_status = DeviceStatus.ERROR
-            self.patient_status = PatientStatus.ERROR
+            if not stop_event.is_set():
+                self.device_status = DeviceStatus.ERROR
+                self.patient_status = PatientStatus.ERROR
         finally:
             self.mark_dirty()
-            if threading.current_thread() is self._device_patient_thread:
-                self._device_patient_thread = None
-                self._device_patient_stop_event = None
+
+    def _fetch_device_and_patient(self, device_id: int, stop_event: threading.Event):
+        """Fetch device and patient data concurrently on the app's event loop."""
+        if stop_event.is_set():
+            return None, None
+
+        loop = getattr(self.app, "loop", None)
+        if loop is None or not loop.is_running():
+            raise RuntimeError("Async loop is not running")
+
+        future = asyncio.run_coroutine_threadsafe(self._fetch_device_and_patient_async(device_id), loop)
+        while not stop_event.is_set():
+            done, _ = wait((future,), timeout=_LOOKUP_POLL_INTERVAL)
+            if done:
+                return future.result()
+        future.cancel()
+        return None, None
+
+    async def _fetch_device_and_patient_async(self, device_id: int):
+        # The two lookups are independent
+        device_data, patient_data = await asyncio.gather(
+            self.server_api.async_fetch_device(device_id),
+            self.server_api.async_fetch_patient_with_device(device_id),
+        )
+        return device_data, patient_data
 
     def mark_dirty(self):
-        self.render_event.set()
+        self._dirty_version += 1
+
+    def mark_logs_dirty(self):
+        self._logs_version += 1
 
     def should_clear(self) -> bool:
         return not self.monitoring_mode
@@ -177,7 +217,9 @@ class RunScreen(BaseScreen):
     def needs_periodic_render(self) -> bool:
         if self.monitoring_mode:
             return True
-        if self.render_event.is_set():
+        if self._dirty_version != self._rendered_version:
+            return True
+        if self._logs_version != self._rendered_logs_version:
             return True
         if self.device_status in (DeviceStatus.CHECKING, DeviceStatus.REGISTERING):
             return True
@@ -186,6 +228,9 @@ class RunScreen(BaseScreen):
         return False
 
     def render(self):
+        version = self._dirty_version
+        logs_version = self._logs_version
+
         if self.server_config_valid and self._initial_check_pending:
             self._initial_check_pending = False
             self.check_device_and_patient()
@@ -197,7 +242,7 @@ class RunScreen(BaseScreen):
             self._stop_sensor_monitoring()
 
         if not self.monitoring_mode:
-            self.render_event.clear()
+            self._rendered_version = version
 
         if (self.monitoring_mode or self.patient_status == PatientStatus.CONNECTED) and not self.monitoring_error:
             if self._render_live_monitor():
@@ -206,16 +251,18 @@ class RunScreen(BaseScreen):
         # Live monitoring not running (or failed to start) - fall back to blessed UI
         if self.monitoring_mode:
             self.monitoring_mode = False
+        # The full redraw below covers any log scrolling too
+        self._rendered_logs_version = logs_version
 
         self.clear_screen()
         self.draw_border("RUN - Real-time Monitoring")
 
         if self.device_status == DeviceStatus.CHECKING:
-            self.render_event.set()
+            self.mark_dirty()
             self.center_text("Checking device registration...", self.height // 2, self.terminal.yellow)
             return
         if self.device_status == DeviceStatus.REGISTERING:
-            self.render_event.set()
+            self.mark_dirty()
             self.center_text("Registering device automatically...", self.height // 2, self.terminal.yellow)
             return
 
@@ -230,7 +277,7 @@ class RunScreen(BaseScreen):
         elif self.patient_status == PatientStatus.NO_PATIENT:
             self._render_no_patient()
         elif self.patient_status == PatientStatus.CHECKING:
-            self.render_event.set()
+            self.mark_dirty()
             self.center_text("Checking patient assignment...", self.height // 2, self.terminal.yellow)
         elif self.patient_status == PatientStatus.CONNECTED:
             self._render_monitoring_unavailable()
@@ -334,7 +381,7 @@ class RunScreen(BaseScreen):
                 # Feed signal to pipeline for processing
                 self.signal_pipeline.process(signal)
         except Exception as e:
-            print(f"Signal feeder error: {e}")
+            self.logger.exception("Signal feeder error")
             self.sensor_active = False
             self.monitoring_error = str(e)
             self.mark_dirty()
@@ -371,9 +418,19 @@ class RunScreen(BaseScreen):
                 if not self.sensor_active:
                     break
 
+                # Keep the published map compact and C-contiguous for the vectorized render
+                heatmap = np.ascontiguousarray(heatmap, dtype=np.float32)
+
+                # Log entries have second resolution, so only format once per second
+                sec = int(timestamp.timestamp())
+                if sec != self._last_ts_sec:
+                    self._last_ts_str = timestamp.strftime("%H:%M:%S")
+                    self._last_ts_sec = sec
+                time_str = self._last_ts_str
+
                 # Prepare log entry outside of lock
                 log_entry = {
-                    'time': timestamp.strftime("%H:%M:%S"),
+                    'time': time_str,
                     'posture': self._posture_to_str(posture.type),
                     'occiput': 'Yes' if posture.occiput else 'No',
                     'scapula': 'Yes' if posture.scapula else 'No',
@@ -404,7 +461,7 @@ class RunScreen(BaseScreen):
                 self.mark_dirty()
 
         except Exception as e:
-            print(f"Sensor processing error: {e}")
+            self.logger.exception("Sensor processing error")
             self.sensor_active = False
             self.monitoring_error = str(e)
             self.mark_dirty()
@@ -440,7 +497,10 @@ class RunScreen(BaseScreen):
         if self.live_display:
             self.live_display.stop()
             self.live_display = None
-            self.live_layout = None
+            # Live.stop() shows the cursor again; the app keeps it hidden for its whole run.
+            # Flushed now: when leaving the screen this buffer isn't flushed again
+            self.write(self.terminal.hide_cursor)
+            self.flush()
 
         # Clear cached data to avoid stale display
         with self.data_lock:
@@ -523,17 +583,30 @@ class RunScreen(BaseScreen):
             pressure_map = pressure_map.copy()
         
         # Convert pressure map to colored text
+        max_val = pressure_map.max()
+        if max_val <= 0:
+            max_val = 1
+        min_val = pressure_map.min()
+
+        if max_val == min_val:
+            normalized = np.full(pressure_map.shape, 0.5, dtype=np.float32)
+        else:
+            normalized = (pressure_map - min_val) / (max_val - min_val)
+        buckets = np.digitize(normalized, _PRESSURE_BINS).astype(np.uint8)
+
+        # Static subjects produce many identical rows, so reuse their markup
         rows = []
-        max_val = np.max(pressure_map) if np.max(pressure_map) > 0 else 1
-        min_val = np.min(pressure_map)
-        
-        for y in range(pressure_map.shape[0]):
-            row_chars = []
-            for x in range(pressure_map.shape[1]):
-                value = pressure_map[y, x]
-                char, color = self._pressure_to_rich_char(value, min_val, max_val)
-                row_chars.append(f"[{color}]{char}[/]")
-            rows.append(" ".join(row_chars))
+        for row_buckets in buckets:
+            row_key = row_buckets.tobytes()
+            row_str = self._row_cache.get(row_key)
+            if row_str is None:
+                row_str = " ".join(_CELL_LUT[row_buckets])
+                self._row_cache[row_key] = row_str
+                if len(self._row_cache) > _ROW_CACHE_SIZE:
+                    self._row_cache.popitem(last=False)
+            else:
+                self._row_cache.move_to_end(row_key)
+            rows.append(row_str)
         
         heatmap_text = "\n".join(rows)
         
@@ -550,24 +623,6 @@ class RunScreen(BaseScreen):
         
         return Panel(content, title="Pressure Heatmap", border_style="green")
     
-    def _pressure_to_rich_char(self, value: float, min_val: float, max_val: float) -> tuple[str, str]:
-        """Convert pressure value to Rich character and color"""
-        if max_val == min_val:
-            normalized = 0.5
-        else:
-            normalized = (value - min_val) / (max_val - min_val)
-        
-        if normalized < 0.2:
-            return "░", "blue"
-        elif normalized < 0.3:
-            return "▒", "cyan"
-        elif normalized < 0.5:
-            return "▓", "yellow"
-        elif normalized < 0.7:
-            return "█", "red"
-        else:
-            return "█", "bright_red"
-    
     def _generate_logs_table_panel(self) -> Panel:
         """Generate logs table panel with transposed layout"""
         table = Table(show_header=True, header_style="bold magenta")
@@ -650,13 +705,21 @@ class RunScreen(BaseScreen):
     def _render_live_monitor(self) -> bool:
         """Update or start the Rich live monitoring display."""
         if not self.sensor_active and not self._start_sensor_monitoring():
-            self.render_event.set()
+            self.mark_dirty()
             return False
 
-        if not self.live_layout:
+        # Reuse the layout tree across monitoring sessions; rebuild only on resize
+        dims = (self.terminal.width, self.terminal.height)
+        layout_changed = False
+        if not self.live_layout or dims != self._layout_dims:
             self.live_layout = self._create_rich_layout()
+            self._layout_dims = dims
+            layout_changed = True
 
         if not self.live_display:
+            layout_changed = True
+            # Put out anything already queued (the frame clear) before Rich takes over the screen
+            self.flush()
             self.live_display = Live(
                 self.live_layout,
                 console=self.console,
@@ -668,13 +731,26 @@ class RunScreen(BaseScreen):
         self.monitoring_mode = True
         self.monitoring_error = None
 
+        # Nothing new since the last frame: Live keeps showing it on its own
+        version = self._dirty_version
+        logs_version = self._logs_version
+        full_update = layout_changed or version != self._rendered_version
+        if not full_update and logs_version == self._rendered_logs_version:
+            return True
+
         try:
-            self._update_live_layout()
+            if full_update:
+                self._update_live_layout()
+            else:
+                # Only the log window scrolled; leave the other panels as they are
+                self.live_layout["logs"].update(self._generate_logs_table_panel())
             self.live_display.update(self.live_layout)
+            self._rendered_version = version
+            self._rendered_logs_version = logs_version
         except Exception as exc:
             self.monitoring_error = f"Display error: {exc}"
             self._stop_sensor_monitoring()
-            self.render_event.set()
+            self.mark_dirty()
             return False
 
         return True
@@ -683,10 +759,10 @@ class RunScreen(BaseScreen):
         if KeyHandler.is_quit(key):
             self._cleanup_on_exit()
             return "main_menu"
-        elif key.lower() == 's' and self.device_status in [DeviceStatus.SERVER_CONFIG_MISSING, DeviceStatus.REGISTRATION_FAILED]:
+        elif key in ('s', 'S') and self.device_status in [DeviceStatus.SERVER_CONFIG_MISSING, DeviceStatus.REGISTRATION_FAILED]:
             self._cleanup_on_exit()
             return "settings"
-        elif key.lower() == 'r':
+        elif key in ('r', 'R'):
             if self.device_status in [DeviceStatus.NOT_REGISTERED, DeviceStatus.REGISTRATION_FAILED]:
                 # Retry device registration
                 self.device_status = DeviceStatus.CHECKING
@@ -703,19 +779,25 @@ class RunScreen(BaseScreen):
         elif self.patient_status == PatientStatus.CONNECTED:
             if KeyHandler.is_arrow_up(key):
                 with self.data_lock:
+                    previous_offset = self.log_scroll_offset
                     max_offset = max(0, len(self.pressure_logs) - self.max_logs_display)
                     if max_offset > 0:
                         self.log_scroll_offset = min(self.log_scroll_offset + 1, max_offset)
                         if self.log_scroll_offset > 0:
                             self.log_follow_latest = False
-                self.mark_dirty()
+                    scrolled = self.log_scroll_offset != previous_offset
+                if scrolled:
+                    self.mark_logs_dirty()
             elif KeyHandler.is_arrow_down(key):
                 with self.data_lock:
+                    previous_offset = self.log_scroll_offset
                     if self.log_scroll_offset > 0:
                         self.log_scroll_offset -= 1
                     if self.log_scroll_offset == 0:
                         self.log_follow_latest = True
-                self.mark_dirty()
+                    scrolled = self.log_scroll_offset != previous_offset
+                if scrolled:
+                    self.mark_logs_dirty()
                 
         return None
 
@@ -727,10 +809,10 @@ class RunScreen(BaseScreen):
             self._stop_sensor_monitoring()
 
     def _cancel_device_patient_check(self):
+        # Runs on the input path under the app's screen lock, so it never waits.
+        # The stale check stops at its next stop_event check, and the next check
+        # queues behind it on the single-worker executor
         if self._device_patient_stop_event:
             self._device_patient_stop_event.set()
-        thread = self._device_patient_thread
-        if thread and thread.is_alive():
-            thread.join(timeout=1.0)
-        self._device_patient_thread = None
+        self._device_patient_future = None
         self._device_patient_stop_event = None
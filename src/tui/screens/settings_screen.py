@@ -1,31 +1,222 @@
+import asyncio
 import logging
 import threading
+import time
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Optional
 
-import numpy as np
 from blessed import Terminal
 
 from .base_screen import BaseScreen
 from ..components.menu import MenuComponent
 from ..components.text_input import TextInputDialog
 from ..utils.keyboard import KeyHandler
+from ..utils.masking import mask_password
 from core.config import config_manager
 from service.device_manager import DeviceManager
 from service.notifications.notification_manager import NotificationManager
 
+# Test heatmap broadcasts: maps of 14x7 cells valued 0-99, generated _HEATMAP_BATCH frames at a time
+_HEATMAP_SHAPE = (14, 7)
+_HEATMAP_BATCH = 64
+
+# Seconds a cached device registration status stays valid
+_DEVICE_STATUS_TTL = 1.0
+
+# Dialogs that show the outcome of a notification or broadcast action
+_NOTIFICATION_DIALOGS = frozenset((
+    "test_notification_success",
+    "test_notification_error",
+    "heatmap_broadcast_started",
+    "heatmap_broadcast_stopped",
+    "heatmap_broadcast_error",
+))
+# Result dialogs that close back to the section detail on Enter
+_RESULT_DIALOGS = _NOTIFICATION_DIALOGS | {"unregister_success", "unregister_error"}
+
+_CURRENT_LABEL = "   Current: "
+
+_INSTRUCTIONS_MAIN = (
+    "Press Enter to configure",
+    "↑↓ to navigate",
+    "'q' to quit",
+)
+_INSTRUCTIONS_DETAIL = (
+    "Enter to edit/toggle",
+    "'b' to go back",
+    "↑↓ to navigate",
+    "'q' to go back",
+)
+
+
+def _load_heatmap_rng():
+    """Import the heatmap generator and warm it up; deferred since only the test broadcast needs it."""
+    from ..utils import rng
+    rng.warm_up()
+    return rng
+
+
+class _HeatmapBroadcastScheduler:
+    """
+    Drives every test heatmap broadcast from a single coroutine on the app loop.
+    Each tick sends one map per registered device through one bulk call.
+    """
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._device_ids: set[int] = set()
+        self._server_api = None
+        self._future: Optional[Future] = None
+        self.interval = 1.0
+
+    def register(self, server_api, loop: asyncio.AbstractEventLoop, device_id: int, interval: float) -> bool:
+        with self._lock:
+            self._server_api = server_api
+            self.interval = interval
+            self._device_ids.add(device_id)
+            if self._future is not None and not self._future.done():
+                return True
+            try:
+                self._future = asyncio.run_coroutine_threadsafe(self._run(), loop)
+            except Exception:
+                self.logger.exception("Failed to schedule heatmap broadcast")
+                self._device_ids.discard(device_id)
+                return False
+            self._future.add_done_callback(self._on_done)
+        return True
+
+    def unregister(self, device_id: int):
+        with self._lock:
+            self._device_ids.discard(device_id)
+            if not self._device_ids and self._future is not None:
+                self._future.cancel()
+                self._future = None
+
+    def _on_done(self, future: Future):
+        if not future.cancelled() and future.exception():
+            self.logger.error("Heatmap broadcast stopped unexpectedly", exc_info=future.exception())
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        # Loading rng can mean importing numba and compiling its kernel: keep that off the shared loop
+        rng = await loop.run_in_executor(None, _load_heatmap_rng)
+        import numpy as np
+
+        # One batch buffer shared by every device, refilled in place
+        batch = np.empty((_HEATMAP_BATCH, *_HEATMAP_SHAPE), dtype=np.uint8)
+        rng_state = rng.new_state()
+        index = len(batch)
+        # Ticks follow a fixed deadline so send latency doesn't stretch the period
+        deadline = loop.time()
+        while True:
+            with self._lock:
+                device_ids = tuple(self._device_ids)
+                server_api = self._server_api
+            if len(device_ids) > len(batch):
+                batch = np.empty((len(device_ids), *_HEATMAP_SHAPE), dtype=np.uint8)
+                index = len(batch)
+            if index + len(device_ids) > len(batch):
+                rng_state = rng.fill_heatmap(batch, rng_state)
+                index = 0
+            updates = [(device_id, batch[index + i]) for i, device_id in enumerate(device_ids)]
+            index += len(updates)
+
+            try:
+                results = await server_api.update_heatmaps_bulk(updates)
+                for device_id, success in zip(device_ids, results):
+                    if not success:
+                        self.logger.warning("Heatmap broadcast returned False for device %s", device_id)
+            except Exception:
+                self.logger.exception("Error broadcasting heatmaps")
+
+            deadline += self.interval
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                # A send overran the whole interval; restart the schedule instead of bursting
+                deadline = loop.time()
+                remaining = 0
+            await asyncio.sleep(remaining)
+
+
+_heatmap_scheduler = _HeatmapBroadcastScheduler()
+
 
 class SettingsScreen(BaseScreen):
-    def __init__(self, terminal: Terminal, app, device_manager: DeviceManager):
+    __slots__ = (
+        "_c_cyan", "_c_yellow", "_c_dim", "_c_bold_cyan", "_c_normal", "_c_red", "_c_green", "_c_white",
+        "app", "device_manager", "view_mode", "sections", "section_menu",
+        "current_section", "_current_configs", "setting_items", "setting_menu", "_section_menus", "_border_title",
+        "_row_templates", "text_input_dialog", "editing_setting", "logger",
+        "notification_manager", "notification_feedback", "notification_feedback_color",
+        "heatmap_broadcasting",
+        "current_heatmap_device_id", "heatmap_broadcast_interval",
+        "_dirty", "_frame", "_prev_frame", "_value_cache", "_cache_version", "_cwd",
+        "_device_status_ts", "_input_handlers",
+        "_instr_positions", "_current_prefix", "_background_frame", "_background_dialog",
+        "_overlay_dialog",
+    )
+
+    SETTINGS_CONFIG = {
+        "Device Registration": {
+            "device_status": {"type": "status", "description": "Device Status", "section": "device"},
+            "send_test_notification": {"type": "action", "description": "Send Test Notification", "section": "device"},
+            "unregister_device": {"type": "action", "description": "Unregister Device", "section": "device"}
+        },
+        "Server Connection": {
+            "url": {"type": "text", "description": "Supabase URL", "section": "supabase"},
+            "api_key": {"type": "password", "description": "Supabase API Key", "section": "supabase"},
+            "test_heatmap_broadcast": {"type": "action", "description": "Test Heatmap Broadcast", "section": "supabase"}
+        },
+        "Debugging Options": {
+            "debug_enabled": {"type": "boolean", "description": "Enable Debug Mode", "section": "debug"},
+            "debug_file": {"type": "text", "description": "Debug Log File Name", "section": "debug"},
+            "log_file_path": {"type": "status", "description": "Current Log File Path", "section": "debug"}
+        }
+    }
+    SECTIONS = ("Device Registration", "Server Connection", "Debugging Options")
+    _ITEMS_BY_SECTION = {name: tuple(cfg.keys()) for name, cfg in SETTINGS_CONFIG.items()}
+    # Raw key -> navigation action; expanded into per-view handler tables at init
+    _KEY_ACTIONS = {
+        **dict.fromkeys(KeyHandler.KEYS_UP, "up"),
+        **dict.fromkeys(KeyHandler.KEYS_DOWN, "down"),
+        **dict.fromkeys(KeyHandler.KEYS_ENTER, "enter"),
+        **dict.fromkeys(KeyHandler.KEYS_QUIT, "quit"),
+        **dict.fromkeys(("b", "B"), "back"),
+    }
+
+    def __init__(self, terminal: Terminal, app, device_manager: Optional[DeviceManager] = None):
         super().__init__(terminal)
+        # Resolved style strings, so render code doesn't go through Terminal attribute lookups
+        self._c_cyan = str(terminal.cyan)
+        self._c_yellow = str(terminal.yellow)
+        self._c_dim = str(terminal.dim)
+        self._c_bold_cyan = str(terminal.bold_cyan)
+        self._c_normal = str(terminal.normal)
+        self._c_red = str(terminal.red)
+        self._c_green = str(terminal.green)
+        self._c_white = str(terminal.white)
         self.app = app
         self.device_manager = device_manager
         self.view_mode = "section_list"  # "section_list", "section_detail", or "text_input"
-        self.sections = ["Device Registration", "Server Connection", "Debugging Options"]
+        # Device registration settings only make sense with a device manager to act on them
+        if device_manager is None:
+            self.sections = tuple(name for name in self.SECTIONS if name != "Device Registration")
+        else:
+            self.sections = self.SECTIONS
         self.section_menu = MenuComponent(terminal, self.sections)
         self.current_section = None
-        self.setting_items = []
-        self.setting_menu = None
+        # Config of the open section, resolved once in enter_section
+        self._current_configs: dict = {}
+        self.setting_items = ()
+        self.setting_menu = MenuComponent(terminal, self.setting_items)
+        # One menu per section, swapped in by enter_section
+        self._section_menus = {
+            name: MenuComponent(terminal, self._ITEMS_BY_SECTION[name]) for name in self.sections
+        }
+        self._border_title = ""
+        self._row_templates = ()
         self.text_input_dialog = None
         self.editing_setting = None
         self.logger = logging.getLogger(__name__)
@@ -34,90 +225,121 @@ class SettingsScreen(BaseScreen):
         self.notification_feedback_color = None
         
         self.heatmap_broadcasting = False
-        self.heatmap_thread: Optional[threading.Thread] = None
-        self.heatmap_stop_event: Optional[threading.Event] = None
         self.current_heatmap_device_id: Optional[int] = None
         self.heatmap_broadcast_interval = 1.0
-        
-        self.settings_config = {
-            "Device Registration": {
-                "device_status": {"type": "status", "description": "Device Status", "section": "device"},
-                "send_test_notification": {"type": "action", "description": "Send Test Notification", "section": "device"},
-                "unregister_device": {"type": "action", "description": "Unregister Device", "section": "device"}
-            },
-            "Server Connection": {
-                "url": {"type": "text", "description": "Supabase URL", "section": "supabase"},
-                "api_key": {"type": "password", "description": "Supabase API Key", "section": "supabase"},
-                "test_heatmap_broadcast": {"type": "action", "description": "Test Heatmap Broadcast", "section": "supabase"}
-            },
-            "Debugging Options": {
-                "debug_enabled": {"type": "boolean", "description": "Enable Debug Mode", "section": "debug"},
-                "debug_file": {"type": "text", "description": "Debug Log File Name", "section": "debug"},
-                "log_file_path": {"type": "status", "description": "Current Log File Path", "section": "debug"}
-            }
-        }
+
+        # Dirty-region rendering: rows are composed in memory and only rows that
+        # differ from the previous frame are written to the terminal.
+        self._dirty = True
+        self._frame: Optional[list] = None
+        self._prev_frame: list = []
+        # Section detail composed behind an open dialog; it can't change while the
+        # dialog is up, so it is composed once per dialog and reused
+        self._background_frame: Optional[list] = None
+        self._background_dialog = None
+        # Dialog whose static parts are currently on screen; typing then redraws only its input line
+        self._overlay_dialog = None
+
+        # Config-backed display values, valid while config_manager.version is unchanged
+        self._value_cache: dict[tuple[str, str], str] = {}
+        self._cache_version = -1
+        self._cwd = Path.cwd()
+        self._device_status_ts = 0.0
+        self._input_handlers = self._build_input_handlers()
+
+        self._instr_positions: dict[str, tuple] = {}
+        self.on_resize(terminal.width, terminal.height)
 
     def enter_section(self, section_name: str):
         self.current_section = section_name
-        self.setting_items = list(self.settings_config[section_name].keys())
-        self.setting_menu = MenuComponent(self.terminal, self.setting_items)
+        self._current_configs = self.SETTINGS_CONFIG[section_name]
+        self.setting_menu = self._section_menus[section_name]
+        self.setting_menu.reset_selection()
+        self.setting_items = self.setting_menu.items
+        self._value_cache.clear()
+        self._border_title = "SETTINGS - " + section_name.upper()
+        self._build_row_templates()
         self.view_mode = "section_detail"
 
+    def _build_row_templates(self):
+        """Compose each setting's selected/unselected label row, styles and border included."""
+        bold_cyan = self._c_bold_cyan
+        normal = self._c_normal
+        self._row_templates = tuple(
+            (self._boxed_row("➤ " + cfg["description"], bold_cyan),
+             self._boxed_row("  " + cfg["description"], normal))
+            for cfg in self._current_configs.values()
+        )
+
     def get_setting_value(self, setting_key: str) -> str:
-        if self.current_section not in self.settings_config:
+        setting_config = self._current_configs.get(setting_key)
+        if setting_config is None:
             return ""
         
-        setting_config = self.settings_config[self.current_section][setting_key]
-        
-        if setting_config["type"] == "status":
-            if setting_key == "device_status":
-                if self.device_manager and self.device_manager.is_registered():
-                    device_id = self.device_manager.get_device_id()
-                    return f"Registered (ID: {device_id})"
-                else:
-                    return "Not Registered"
-            elif setting_key == "log_file_path":
-                debug_file = config_manager.get_setting("debug", "debug_file", fallback="debug.log")
-                log_path = Path.cwd() / debug_file
-                return str(log_path)
-        elif setting_config["type"] == "action":
+        if setting_config["type"] == "action":
             if setting_key == "test_heatmap_broadcast":
                 return "Running (press Enter to stop)" if self.heatmap_broadcasting else "Stopped (press Enter to start)"
             return "Click to execute"
-        
+
+        if self._cache_version != config_manager.version:
+            self._value_cache.clear()
+            self._cache_version = config_manager.version
+
+        cache_key = (self.current_section, setting_key)
+        if setting_key == "device_status":
+            # Registration can change outside this screen, so refresh it periodically
+            now = time.monotonic()
+            if now - self._device_status_ts >= _DEVICE_STATUS_TTL:
+                self._value_cache.pop(cache_key, None)
+                self._device_status_ts = now
+        value = self._value_cache.get(cache_key)
+        if value is None:
+            value = self._read_setting_value(setting_key, setting_config)
+            self._value_cache[cache_key] = value
+        return value
+
+    def _read_setting_value(self, setting_key: str, setting_config: dict) -> str:
+        if setting_key == "device_status":
+            if self.device_manager and self.device_manager.is_registered():
+                device_id = self.device_manager.get_device_id()
+                return f"Registered (ID: {device_id})"
+            else:
+                return "Not Registered"
+
+        if setting_key == "log_file_path":
+            debug_file = config_manager.get_setting("debug", "debug_file", fallback="debug.log")
+            log_path = self._cwd / debug_file
+            return str(log_path)
+
         section = setting_config["section"]
+        if setting_config["type"] == "boolean":
+            return "Enabled" if config_manager.get_bool_setting(section, setting_key) else "Disabled"
+
         value = config_manager.get_setting(section, setting_key, fallback="")
         
-        if setting_config["type"] == "boolean":
-            return "Enabled" if value.lower() in ["true", "1", "yes", "on"] else "Disabled"
-        elif setting_config["type"] == "password":
+        if setting_config["type"] == "password":
             if not value:
                 return "Not Set"
-            # Show first 4 chars + asterisks + last 4 chars for long values
-            if len(value) > 12:
-                return f"{value[:4]}{'*' * 8}{value[-4:]}"
-            else:
-                return "*" * len(value)
+            return mask_password(value)
         
         return value or "Not Set"
 
     def toggle_boolean_setting(self, setting_key: str):
-        if self.current_section not in self.settings_config:
+        setting_config = self._current_configs.get(setting_key)
+        if setting_config is None:
             return
             
-        setting_config = self.settings_config[self.current_section][setting_key]
         section = setting_config["section"]
         
-        current_value = config_manager.get_setting(section, setting_key, fallback="false")
-        new_value = "false" if current_value.lower() in ["true", "1", "yes", "on"] else "true"
+        new_value = "false" if config_manager.get_bool_setting(section, setting_key) else "true"
         
         config_manager.update_setting(section, setting_key, new_value)
 
     def start_text_edit(self, setting_key: str):
-        if self.current_section not in self.settings_config:
+        setting_config = self._current_configs.get(setting_key)
+        if setting_config is None:
             return
             
-        setting_config = self.settings_config[self.current_section][setting_key]
         section = setting_config["section"]
         current_value = config_manager.get_setting(section, setting_key, fallback="")
         
@@ -133,10 +355,10 @@ class SettingsScreen(BaseScreen):
         self.view_mode = "text_input"
 
     def save_text_setting(self, new_value: str):
-        if not self.editing_setting or self.current_section not in self.settings_config:
+        setting_config = self._current_configs.get(self.editing_setting)
+        if setting_config is None:
             return
             
-        setting_config = self.settings_config[self.current_section][self.editing_setting]
         section = setting_config["section"]
         
         config_manager.update_setting(section, self.editing_setting, new_value)
@@ -149,134 +371,195 @@ class SettingsScreen(BaseScreen):
         self.text_input_dialog = None
         self.view_mode = "section_detail"
 
+    def should_clear(self) -> bool:
+        return False
+
+    def on_resize(self, width: int, height: int):
+        super().on_resize(width, height)
+        # Instruction rows only move when the window size changes; styles are baked in
+        dim = self._c_dim
+        normal = self._c_normal
+        self._instr_positions = {
+            "section_list": tuple(
+                (dim + text + normal, (self.width - len(text)) // 2, self.height - 5 + i)
+                for i, text in enumerate(_INSTRUCTIONS_MAIN)
+            ),
+            "section_detail": tuple(
+                (dim + text + normal, 3 + i * 20, self.height - 2)
+                for i, text in enumerate(_INSTRUCTIONS_DETAIL)
+            ),
+        }
+        self._current_prefix = "│  " + self._c_yellow + _CURRENT_LABEL
+        if self.current_section:
+            self._build_row_templates()
+        # Geometry changed: repaint everything, including an open dialog's box
+        self._invalidate_frame()
+
+    def draw_text(self, text: str, x: int, y: int, color=None):
+        if self._frame is None or not 0 <= y < len(self._frame):
+            super().draw_text(text, x, y, color)
+            return
+        if color:
+            text = color + text + self._c_normal
+        self._frame[y] += self.terminal.move_xy(x, y) + text
+
     def render(self):
-        self.clear_screen()
+        if not self._dirty:
+            return
+        self._dirty = False
+        self._frame = [""] * self.terminal.height
         
-        if self.view_mode == "section_list":
-            self._render_section_list()
-        elif self.view_mode == "section_detail":
-            self._render_section_detail()
-        elif self.view_mode == "text_input":
+        if self.view_mode == "text_input":
+            background = self._background_frame
+            if (background is None or self._background_dialog is not self.text_input_dialog
+                    or len(background) != len(self._frame)):
+                # Render the section detail in the background
+                self._render_section_detail()
+                if self.text_input_dialog:
+                    # Rows under the dialog are repainted by the dialog itself
+                    _, dialog_y, _, dialog_height = self._dialog_geometry()
+                    for row in range(dialog_y, min(dialog_y + dialog_height, len(self._frame))):
+                        self._frame[row] = None
+                self._background_frame = list(self._frame)
+                self._background_dialog = self.text_input_dialog
+            else:
+                self._frame = list(background)
+        else:
+            self._background_frame = None
+            self._background_dialog = None
+            if self.view_mode == "section_list":
+                self._render_section_list()
+            elif self.view_mode == "section_detail":
+                self._render_section_detail()
+
+        self._emit_frame()
+
+        if self.view_mode == "text_input":
             self._render_text_input()
 
+    def _emit_frame(self):
+        frame = self._frame
+        self._frame = None
+        out = []
+        if len(self._prev_frame) != len(frame):
+            # First frame on this screen (or terminal resized): start from a blank screen
+            out.append(self.terminal.home + self.terminal.clear)
+            self._overlay_dialog = None
+            prev = [""] * len(frame)
+        else:
+            prev = self._prev_frame
+
+        for y, row in enumerate(frame):
+            # None marks rows owned by an overlay that is drawn directly
+            if row is not None and row != prev[y]:
+                out.append(self.terminal.move_xy(0, y) + self.terminal.clear_eol + row)
+
+        self._prev_frame = frame
+        if out:
+            self.write("".join(out))
+
+    def _invalidate_frame(self):
+        self._prev_frame = []
+        self._background_frame = None
+        self._overlay_dialog = None
+        self._dirty = True
+
+    def _dialog_geometry(self) -> tuple[int, int, int, int]:
+        dialog_width = min(60, self.width - 10)
+        dialog_height = 12
+        dialog_x = (self.width - dialog_width) // 2
+        dialog_y = (self.height - dialog_height) // 2
+        return dialog_x, dialog_y, dialog_width, dialog_height
+
     def _render_section_list(self):
         self.draw_border("SETTINGS")
         
-        self.center_text("Select a settings category to configure", 4, self.terminal.cyan)
+        self.center_text("Select a settings category to configure", 4, self._c_cyan)
         
         menu_y = 7
         menu_x = (self.width - 30) // 2
-        self.section_menu.render(menu_x, menu_y)
+        self.draw_menu(self.section_menu, menu_x, menu_y)
         
-        instructions = [
-            "Press Enter to configure",
-            "↑↓ to navigate",
-            "'q' to quit"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            self.center_text(instruction, self.height - 5 + i, self.terminal.dim)
+        for text, x, y in self._instr_positions["section_list"]:
+            self.draw_text(text, x, y)
 
     def _render_section_detail(self):
         if not self.current_section:
             return
             
-        self.draw_border(f"SETTINGS - {self.current_section.upper()}")
+        self.draw_border(self._border_title)
         
         start_y = 4
         
-        if self.setting_menu and self.setting_items:
+        if self.setting_items:
+            selected_index = self.setting_menu.get_selected_index()
+            frame = self._frame
+            normal = self._c_normal
+            value_width = self.width - 4 - len(_CURRENT_LABEL)
             for i, setting_key in enumerate(self.setting_items):
                 item_y = start_y + i * 2
                 if item_y >= self.height - 6:
                     break
                 
-                setting_config = self.settings_config[self.current_section][setting_key]
-                description = setting_config["description"]
                 value = self.get_setting_value(setting_key)
+                selected_line, unselected_line = self._row_templates[i]
                 
-                # Highlight selected item
-                if i == self.setting_menu.get_selected_index():
-                    prefix = "➤ "
-                    color = self.terminal.bold_cyan
-                else:
-                    prefix = "  "
-                    color = self.terminal.normal
-                
-                setting_line = f"{prefix}{description}"
-                value_line = f"   Current: {value}"
-                
-                self.draw_text(setting_line, 3, item_y, color)
-                self.draw_text(value_line, 3, item_y + 1, self.terminal.yellow)
+                # Each row is composed whole, border included, so it costs one cursor move
+                frame[item_y] = selected_line if i == selected_index else unselected_line
+                row = self._current_prefix + value + normal
+                padding = value_width - len(value)
+                if padding >= 0:
+                    row += " " * padding + "│"
+                frame[item_y + 1] = row
         
-        instructions = [
-            "Enter to edit/toggle",
-            "'b' to go back",
-            "↑↓ to navigate",
-            "'q' to go back"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            self.draw_text(instruction, 3 + i * 20, self.height - 2, self.terminal.dim)
+        for text, x, y in self._instr_positions["section_detail"]:
+            self.draw_text(text, x, y)
+
+    def _boxed_row(self, text: str, color) -> str:
+        """Return a bordered window row with text at column 3, as draw_border + draw_text would leave it."""
+        row = "│  " + color + text + self._c_normal
+        padding = self.width - 4 - len(text)
+        if padding >= 0:
+            row += " " * padding + "│"
+        return row
 
     def _render_text_input(self):
-        # Render the section detail in the background
-        self._render_section_detail()
-        
         # Overlay the text input dialog
         if self.text_input_dialog:
-            dialog_width = min(60, self.width - 10)
-            dialog_height = 12
-            dialog_x = (self.width - dialog_width) // 2
-            dialog_y = (self.height - dialog_height) // 2
+            dialog_x, dialog_y, dialog_width, dialog_height = self._dialog_geometry()
             
-            self.text_input_dialog.render(dialog_x, dialog_y, dialog_width, dialog_height)
+            full = self._overlay_dialog is not self.text_input_dialog
+            self.write(self.text_input_dialog.compose(dialog_x, dialog_y, dialog_width, dialog_height, static=full))
+            self._overlay_dialog = self.text_input_dialog
+            if not full:
+                return
             
             # Add additional context for special dialogs
             if self.editing_setting == "confirm_unregister":
                 self.draw_text("⚠️  This will remove the device from the server.", 
-                             dialog_x + 2, dialog_y + 3, self.terminal.yellow)
+                             dialog_x + 2, dialog_y + 3, self._c_yellow)
                 self.draw_text("Type 'CONFIRM' to proceed:", 
-                             dialog_x + 2, dialog_y + 4, self.terminal.white)
+                             dialog_x + 2, dialog_y + 4, self._c_white)
             elif self.editing_setting == "unregister_success":
                 self.draw_text("✅ Operation completed successfully!", 
-                             dialog_x + 2, dialog_y + 3, self.terminal.green)
+                             dialog_x + 2, dialog_y + 3, self._c_green)
                 self.draw_text("Press Enter to continue", 
-                             dialog_x + 2, dialog_y + 4, self.terminal.dim)
+                             dialog_x + 2, dialog_y + 4, self._c_dim)
             elif self.editing_setting == "unregister_error":
                 self.draw_text("❌ Check server connection and try again", 
-                             dialog_x + 2, dialog_y + 3, self.terminal.red)
+                             dialog_x + 2, dialog_y + 3, self._c_red)
                 self.draw_text("Press Enter to continue", 
-                             dialog_x + 2, dialog_y + 4, self.terminal.dim)
-            elif self.editing_setting in [
-                "test_notification_success",
-                "test_notification_error",
-                "heatmap_broadcast_started",
-                "heatmap_broadcast_stopped",
-                "heatmap_broadcast_error"
-            ]:
-                if self.notification_feedback:
-                    message = self.notification_feedback
-                elif self.editing_setting.startswith("test_notification"):
-                    message = "✅ Test notification sent successfully." if self.editing_setting.endswith("success") else "❌ Failed to send test notification."
-                elif self.editing_setting == "heatmap_broadcast_started":
-                    message = "✅ 랜덤 히트맵 브로드캐스트를 시작했습니다."
-                elif self.editing_setting == "heatmap_broadcast_stopped":
-                    message = "✅ 랜덤 히트맵 브로드캐스트를 중지했습니다."
-                else:
-                    message = "❌ 히트맵 브로드캐스트에 실패했습니다."
-
-                color = self.notification_feedback_color
-                if color is None:
-                    color = self.terminal.red if self.editing_setting.endswith("error") else self.terminal.green
-
-                self.draw_text(message,
-                             dialog_x + 2, dialog_y + 3, color)
+                             dialog_x + 2, dialog_y + 4, self._c_dim)
+            elif self.editing_setting in _NOTIFICATION_DIALOGS:
+                # Message and color are fixed by _show_notification_feedback
+                self.draw_text(self.notification_feedback,
+                             dialog_x + 2, dialog_y + 3, self.notification_feedback_color)
                 self.draw_text("Press Enter to continue",
-                             dialog_x + 2, dialog_y + 4, self.terminal.dim)
+                             dialog_x + 2, dialog_y + 4, self._c_dim)
 
     def handle_input(self, key: str) -> Optional[str]:
         if self.view_mode == "text_input":
+            self._dirty = True
             if self.text_input_dialog:
                 result = self.text_input_dialog.handle_input(key)
                 if result == "save":
@@ -284,15 +567,7 @@ class SettingsScreen(BaseScreen):
                     if new_value is not None:
                         if self.editing_setting == "confirm_unregister":
                             self.confirm_device_unregistration(new_value)
-                        elif self.editing_setting in [
-                            "unregister_success",
-                            "unregister_error",
-                            "test_notification_success",
-                            "test_notification_error",
-                            "heatmap_broadcast_started",
-                            "heatmap_broadcast_stopped",
-                            "heatmap_broadcast_error"
-                        ]:
+                        elif self.editing_setting in _RESULT_DIALOGS:
                             # Return to settings after showing result message
                             self.editing_setting = None
                             self.text_input_dialog = None
@@ -308,54 +583,96 @@ class SettingsScreen(BaseScreen):
                     self.notification_feedback = ""
                     self.notification_feedback_color = None
             return None
-        
-        if KeyHandler.is_quit(key):
-            if self.view_mode == "section_detail":
-                self.view_mode = "section_list"
-                self.current_section = None
-                return None
-            else:
-                return "main_menu"
-        
-        if self.view_mode == "section_list":
-            if KeyHandler.is_arrow_up(key):
-                self.section_menu.move_up()
-            elif KeyHandler.is_arrow_down(key):
-                self.section_menu.move_down()
-            elif KeyHandler.is_enter(key):
-                selected_section = self.section_menu.get_selected_item()
-                self.enter_section(selected_section)
-        
-        elif self.view_mode == "section_detail":
-            if key.lower() == 'b':
-                self.view_mode = "section_list"
-                self.current_section = None
-            elif self.setting_menu:
-                if KeyHandler.is_arrow_up(key):
-                    self.setting_menu.move_up()
-                elif KeyHandler.is_arrow_down(key):
-                    self.setting_menu.move_down()
-                elif KeyHandler.is_enter(key):
-                    selected_index = self.setting_menu.get_selected_index()
-                    if selected_index < len(self.setting_items):
-                        setting_key = self.setting_items[selected_index]
-                        setting_config = self.settings_config[self.current_section][setting_key]
-                        
-                        if setting_config["type"] == "boolean":
-                            self.toggle_boolean_setting(setting_key)
-                        elif setting_config["type"] == "action":
-                            if setting_key == "unregister_device":
-                                self.handle_device_unregistration()
-                            elif setting_key == "send_test_notification":
-                                self.handle_test_notification()
-                            elif setting_key == "test_heatmap_broadcast":
-                                self.handle_heatmap_broadcast_action()
-                        elif setting_config["type"] in ["text", "password"]:
-                            self.start_text_edit(setting_key)
-        
-        return None
+
+        # Pasted text only means something to the text input dialog
+        if len(key) > 1 and not key.startswith('KEY_'):
+            return None
+
+        handler = self._input_handlers.get(self.view_mode, {}).get(key)
+        if handler is None:
+            return None
+        return handler()
+
+    def _build_input_handlers(self) -> dict:
+        """Map each view's keys straight to bound handlers, one dict probe per keystroke."""
+        by_action = {
+            "section_list": {
+                "quit": self._leave_settings,
+                "up": self._section_up,
+                "down": self._section_down,
+                "enter": self._open_selected_section,
+            },
+            "section_detail": {
+                "quit": self._back_to_section_list,
+                "back": self._back_to_section_list,
+                "up": self._setting_up,
+                "down": self._setting_down,
+                "enter": self._activate_selected_setting,
+            },
+        }
+        return {
+            view: {key: actions[action] for key, action in self._KEY_ACTIONS.items() if action in actions}
+            for view, actions in by_action.items()
+        }
+
+    def _leave_settings(self) -> str:
+        # Another screen takes over the terminal; repaint fully on return
+        self._invalidate_frame()
+        return "main_menu"
+
+    def _section_up(self):
+        self.section_menu.move_up()
+        self._dirty = True
+
+    def _section_down(self):
+        self.section_menu.move_down()
+        self._dirty = True
+
+    def _open_selected_section(self):
+        selected_section = self.section_menu.get_selected_item()
+        self.enter_section(selected_section)
+        self._dirty = True
+
+    def _back_to_section_list(self):
+        self.view_mode = "section_list"
+        self.current_section = None
+        self._current_configs = {}
+        self.setting_items = ()
+        self._dirty = True
+
+    def _setting_up(self):
+        if self.setting_items:
+            self.setting_menu.move_up()
+            self._dirty = True
+
+    def _setting_down(self):
+        if self.setting_items:
+            self.setting_menu.move_down()
+            self._dirty = True
+
+    def _activate_selected_setting(self):
+        if not self.setting_items:
+            return
+        self._dirty = True
+        selected_index = self.setting_menu.get_selected_index()
+        if selected_index >= len(self.setting_items):
+            return
+        setting_key = self.setting_items[selected_index]
+        setting_config = self._current_configs[setting_key]
+
+        if setting_config["type"] == "boolean":
+            self.toggle_boolean_setting(setting_key)
+        elif setting_config["type"] == "action":
+            if setting_key == "unregister_device":
+                self.handle_device_unregistration()
+            elif setting_key == "send_test_notification":
+                self.handle_test_notification()
+            elif setting_key == "test_heatmap_broadcast":
+                self.handle_heatmap_broadcast_action()
+        elif setting_config["type"] in ("text", "password"):
+            self.start_text_edit(setting_key)
     
-    def _show_notification_feedback(self, status_key: str, title: str, message: str, color):
+    def _show_notification_feedback(self, status_key: str, title: str, message: str, color: str):
         self.editing_setting = status_key
         self.notification_feedback = message
         self.notification_feedback_color = color
@@ -375,7 +692,7 @@ class SettingsScreen(BaseScreen):
                 "test_notification_error",
                 "Test Notification Failed",
                 "❌ 등록된 디바이스가 없습니다. 먼저 디바이스를 등록하세요.",
-                self.terminal.red
+                self._c_red
             )
             return
 
@@ -386,7 +703,7 @@ class SettingsScreen(BaseScreen):
                 "test_notification_error",
                 "Test Notification Failed",
                 "❌ 디바이스 ID를 확인할 수 없습니다.",
-                self.terminal.red
+                self._c_red
             )
             return
 
@@ -406,7 +723,7 @@ class SettingsScreen(BaseScreen):
                 "test_notification_success",
                 "Test Notification Sent",
                 message,
-                self.terminal.green
+                self._c_green
             )
         else:
             message = "❌ 테스트 알림 전송에 실패했습니다. Firebase 설정을 확인하세요."
@@ -414,7 +731,7 @@ class SettingsScreen(BaseScreen):
                 "test_notification_error",
                 "Test Notification Failed",
                 message,
-                self.terminal.red
+                self._c_red
             )
 
 
@@ -430,14 +747,14 @@ class SettingsScreen(BaseScreen):
                     "heatmap_broadcast_stopped",
                     "Heatmap Broadcast",
                     message,
-                    self.terminal.green
+                    self._c_green
                 )
             else:
                 self._show_notification_feedback(
                     "heatmap_broadcast_error",
                     "Heatmap Broadcast",
                     "❌ 히트맵 브로드캐스트를 중지할 수 없습니다.",
-                    self.terminal.red
+                    self._c_red
                 )
             return
 
@@ -446,7 +763,7 @@ class SettingsScreen(BaseScreen):
                 "heatmap_broadcast_error",
                 "Heatmap Broadcast",
                 "❌ 등록된 디바이스가 없습니다. 먼저 디바이스를 등록하세요.",
-                self.terminal.red
+                self._c_red
             )
             return
 
@@ -456,7 +773,7 @@ class SettingsScreen(BaseScreen):
                 "heatmap_broadcast_error",
                 "Heatmap Broadcast",
                 "❌ 디바이스 ID를 확인할 수 없습니다.",
-                self.terminal.red
+                self._c_red
             )
             return
 
@@ -466,7 +783,7 @@ class SettingsScreen(BaseScreen):
                 "heatmap_broadcast_error",
                 "Heatmap Broadcast",
                 "❌ 서버 연결이 설정되지 않았습니다. Supabase 설정을 확인하세요.",
-                self.terminal.red
+                self._c_red
             )
             return
 
@@ -476,14 +793,14 @@ class SettingsScreen(BaseScreen):
                 "heatmap_broadcast_started",
                 "Heatmap Broadcast",
                 message,
-                self.terminal.green
+                self._c_green
             )
         else:
             self._show_notification_feedback(
                 "heatmap_broadcast_error",
                 "Heatmap Broadcast",
                 "❌ 히트맵 브로드캐스트를 시작할 수 없습니다.",
-                self.terminal.red
+                self._c_red
             )
 
     def start_heatmap_broadcast(self, device_id: int) -> bool:
@@ -495,29 +812,17 @@ class SettingsScreen(BaseScreen):
             self.logger.error("Server API is not available. Cannot start heatmap broadcast.")
             return False
 
-        stop_event = threading.Event()
-        thread = threading.Thread(
-            target=self._heatmap_broadcast_worker,
-            args=(device_id, stop_event),
-            daemon=True,
-            name=f"HeatmapBroadcast-{device_id}"
-        )
+        loop = getattr(self.app, "loop", None)
+        if loop is None or not loop.is_running():
+            self.logger.error("Async loop is not running. Cannot start heatmap broadcast.")
+            return False
+
+        if not _heatmap_scheduler.register(server_api, loop, device_id, self.heatmap_broadcast_interval):
+            return False
 
-        self.heatmap_stop_event = stop_event
-        self.heatmap_thread = thread
         self.current_heatmap_device_id = device_id
         self.heatmap_broadcasting = True
 
-        try:
-            thread.start()
-        except Exception:
-            self.logger.exception("Failed to start heatmap broadcast thread")
-            self.heatmap_thread = None
-            self.heatmap_stop_event = None
-            self.current_heatmap_device_id = None
-            self.heatmap_broadcasting = False
-            return False
-
         self.logger.info("Started heatmap broadcast test for device %s", device_id)
         return True
 
@@ -525,42 +830,14 @@ class SettingsScreen(BaseScreen):
         if not self.heatmap_broadcasting:
             return False
 
-        stop_event = self.heatmap_stop_event
-        thread = self.heatmap_thread
+        _heatmap_scheduler.unregister(self.current_heatmap_device_id)
 
-        if stop_event:
-            stop_event.set()
-
-        if thread and thread.is_alive() and thread is not threading.current_thread():
-            thread.join(timeout=1.0)
-
-        self.heatmap_thread = None
-        self.heatmap_stop_event = None
         self.heatmap_broadcasting = False
         self.current_heatmap_device_id = None
 
         self.logger.info("Stopped heatmap broadcast test")
         return True
 
-    def _heatmap_broadcast_worker(self, device_id: int, stop_event: threading.Event):
-        server_api = getattr(self.app, "server_api", None)
-        if not server_api:
-            self.logger.error("Server API is not available inside heatmap broadcast worker")
-            return
-
-        while not stop_event.is_set():
-            heatmap = np.random.randint(0, 100, size=(14, 7))
-            try:
-                success = server_api.update_heatmap_sync(device_id, heatmap)
-                if not success:
-                    self.logger.warning("Heatmap broadcast returned False for device %s", device_id)
-            except Exception:
-                self.logger.exception("Error broadcasting heatmap for device %s", device_id)
-
-            if stop_event.wait(self.heatmap_broadcast_interval):
-                break
-
-
     def handle_device_unregistration(self):
         self.notification_feedback = ""
         self.notification_feedback_color = None
@@ -1,33 +1,46 @@
+import re
+
 from blessed import Terminal
 
+# Longest run of pasted text returned by a single get_key call
+MAX_PASTE_LENGTH = 1000
+_CONTROL_CHAR = re.compile(r"[\x00-\x1f\x7f]")
+
 
 class KeyHandler:
+    # Key sets behind the predicates below, for callers that build lookup tables
+    KEYS_UP = frozenset(('KEY_UP',))
+    KEYS_DOWN = frozenset(('KEY_DOWN',))
+    KEYS_ENTER = frozenset(('KEY_ENTER', '\n', '\r'))
+    KEYS_QUIT = frozenset(('q', 'Q'))
+
     def __init__(self, terminal: Terminal):
         self.terminal = terminal
 
-    def get_key(self):
-        with self.terminal.cbreak(), self.terminal.hidden_cursor():
-            key = self.terminal.inkey(timeout=0.1)
-            if not key:
-                return ""
-            
-            if key.is_sequence:
-                return key.name
-            else:
-                # Check if there are more characters waiting (for paste operations)
-                result = str(key)
-                while True:
-                    next_key = self.terminal.inkey(timeout=0.01)
-                    if not next_key:
-                        break
-                    if next_key.is_sequence:
-                        # If we hit a sequence key, put it back and break
-                        break
-                    result += str(next_key)
-                    # Limit paste size to prevent buffer overflow
-                    if len(result) > 1000:
-                        break
-                return result
+    def get_key(self, timeout: float = 0.1):
+        """Read one key; the caller keeps the terminal in cbreak mode."""
+        key = self.terminal.inkey(timeout=timeout)
+        if not key:
+            return ""
+        
+        if key.is_sequence:
+            return key.name
+
+        # A paste arrives as one burst: take everything already received in one go
+        result = str(key) + self.terminal.flushinp()
+        # Control characters and escape sequences (Enter, arrows, ...) are left
+        # for the next call so they are still returned as named keys
+        if _CONTROL_CHAR.match(result):
+            # A control key (Ctrl+A, Ctrl+Space, ...) read first is a key of its own
+            end = 1
+        else:
+            match = _CONTROL_CHAR.search(result)
+            end = match.start() if match else len(result)
+        # Limit paste size to prevent buffer overflow
+        end = min(end, MAX_PASTE_LENGTH)
+        if end < len(result):
+            self.terminal.ungetch(result[end:])
+        return result[:end]
 
     @staticmethod
     def is_arrow_up(key: str) -> bool:
@@ -47,11 +60,12 @@ class KeyHandler:
 
     @staticmethod
     def is_enter(key: str) -> bool:
-        return key in ('KEY_ENTER', '\n', '\r')
+        return key in KeyHandler.KEYS_ENTER
 
     @staticmethod
     def is_quit(key: str) -> bool:
-        return key.lower() == 'q'
+        # Direct comparisons bail out on length, so pasted text is never lowercased
+        return key == 'q' or key == 'Q'
 
     @staticmethod
     def is_escape(key: str) -> bool:
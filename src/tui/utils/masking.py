@@ -0,0 +1,11 @@
+import functools
+
+_MASK_8 = "********"
+
+
+@functools.lru_cache(maxsize=32)
+def mask_password(value: str) -> str:
+    """Show first 4 chars + asterisks + last 4 chars for long values, all asterisks otherwise."""
+    if len(value) > 12:
+        return value[:4] + _MASK_8 + value[-4:]
+    return "*" * len(value)
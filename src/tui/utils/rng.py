@@ -0,0 +1,53 @@
+"""
+Random heatmap generation for the test broadcast.
+Uses a numba-compiled LCG when numba is installed, NumPy's Generator otherwise.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_LCG_MULTIPLIER = np.uint64(6364136223846793005)
+_LCG_INCREMENT = np.uint64(1442695040888963407)
+_SHIFT = np.uint64(33)
+_RANGE = np.uint64(100)
+
+# Fallback generator, used only when numba is unavailable
+_RNG = np.random.Generator(np.random.PCG64DXSM())
+
+HAS_NUMBA = njit is not None
+
+
+def new_state() -> np.uint64:
+    """Return a fresh random seed for fill_heatmap."""
+    return np.uint64(np.random.SeedSequence().generate_state(1, dtype=np.uint64)[0])
+
+
+if HAS_NUMBA:
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _fill_lcg(out, state):
+        for i in range(out.shape[0]):
+            state = state * _LCG_MULTIPLIER + _LCG_INCREMENT
+            out[i] = (state >> _SHIFT) % _RANGE
+        return state
+
+
+def warm_up():
+    """Compile the numba kernel now so the first fill_heatmap call doesn't pay for it."""
+    if HAS_NUMBA:
+        _fill_lcg(np.empty(1, dtype=np.uint8), new_state())
+
+
+def fill_heatmap(out: np.ndarray, state: np.uint64) -> np.uint64:
+    """
+    Fill a C-contiguous uint8 array in place with values 0-99.
+    Returns the state to pass to the next call.
+    """
+    # The kernel hands back a plain int; keeping the state uint64 avoids a second
+    # (int64) specialization and keeps the LCG unsigned
+    if HAS_NUMBA:
+        return np.uint64(_fill_lcg(out.reshape(-1), state))
+    out[...] = _RNG.integers(0, 100, size=out.shape, dtype=out.dtype)
+    return np.uint64(state)
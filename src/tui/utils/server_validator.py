@@ -1,14 +1,38 @@
+import functools
+
 from core.config import config_manager
-from typing import Tuple, List
+from typing import Optional, Sequence, Tuple
+
+_WARN_HEADER = (
+    "⚠️  Server configuration required",
+    "",
+    "Missing settings:",
+)
+_WARN_FOOTER = (
+    "",
+    "Please configure these settings in:",
+    "Settings → Server Connection",
+    "",
+    "Press 's' to go to Settings, 'q' to go back",
+)
 
 
 class ServerValidator:
-    @staticmethod
-    def validate_server_config() -> Tuple[bool, List[str]]:
+    # (config version, result) of the last validation; the config can only change
+    # through config_manager, which bumps its version on every write
+    _cache: Optional[Tuple[int, Tuple[bool, Tuple[str, ...]]]] = None
+
+    @classmethod
+    def validate_server_config(cls) -> Tuple[bool, Tuple[str, ...]]:
         """
         Validates server configuration settings.
-        Returns (is_valid, missing_settings_list)
+        Returns (is_valid, missing_settings)
         """
+        version = config_manager.version
+        cached = cls._cache
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
         missing_settings = []
         
         # Check Supabase URL
@@ -22,31 +46,20 @@ class ServerValidator:
             missing_settings.append("Supabase API Key")
         
         is_valid = len(missing_settings) == 0
-        return is_valid, missing_settings
+        result = (is_valid, tuple(missing_settings))
+        cls._cache = (version, result)
+        return result
 
     @staticmethod
-    def get_server_config_warning_message(missing_settings: List[str]) -> List[str]:
+    def get_server_config_warning_message(missing_settings: Sequence[str]) -> Tuple[str, ...]:
         """
         Generates warning message lines for missing server configuration.
         """
         if not missing_settings:
-            return []
-        
-        lines = [
-            "⚠️  Server configuration required",
-            "",
-            "Missing settings:",
-        ]
-        
-        for setting in missing_settings:
-            lines.append(f"  • {setting}")
-        
-        lines.extend([
-            "",
-            "Please configure these settings in:",
-            "Settings → Server Connection",
-            "",
-            "Press 's' to go to Settings, 'q' to go back"
-        ])
-        
-        return lines
\ No newline at end of file
+            return ()
+        return _warning_lines(tuple(missing_settings))
+
+
+@functools.lru_cache(maxsize=8)
+def _warning_lines(missing_settings: Tuple[str, ...]) -> Tuple[str, ...]:
+    return (*_WARN_HEADER, *(f"  • {setting}" for setting in missing_settings), *_WARN_FOOTER)